@@ -1,15 +1,28 @@
 import contextlib
+import gzip
 import os
-import urllib.request
+import pickle
+import shutil
+import tempfile
+from collections import OrderedDict
 import warnings
-from io import BytesIO
 from typing import Any, Tuple, List
 from zipfile import ZipFile
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import urllib3
+from pyarrow import csv as pacsv
+from pyarrow import parquet as paparquet
 
 import haversine
 
+try:
+    import numba
+except ImportError:  # numba is an optional speedup, numpy path works too
+    numba = None
+
 STORAGE_DIR = os.environ.get(
     "PGEOCODE_DATA_DIR", os.path.join(os.path.expanduser("~"), "pgeocode_data")
 )
@@ -21,6 +34,13 @@ DOWNLOAD_URL = [
     "https://symerio.github.io/postal-codes-data/data/geonames/{country}.txt",
 ]
 
+# Shared pool so downloads for several countries reuse one connection;
+# gzip transfer roughly quarters the wire bytes for the plain .txt URL.
+_HTTP = urllib3.PoolManager(
+    retries=urllib3.Retry(total=3, backoff_factor=0.5),
+    headers={"Accept-Encoding": "gzip"},
+)
+
 
 DATA_FIELDS = [
     "country_code",
@@ -37,7 +57,62 @@ DATA_FIELDS = [
     "accuracy",
 ]
 
-COUNTRIES_VALID = [
+# Maximum number of per-country unique geo DataFrames kept in memory.
+UNIQUE_GEO_CACHE_SIZE = 32
+
+# Mean earth radius in km, same value the haversine package uses.
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _haversine_batch_np(lat1, lon1, lat2, lon2, cos_lat1, cos_lat2):
+    """Haversine distance in km over arrays of coordinates in radians
+
+    All inputs are numpy arrays of the same length; cos_lat1/cos_lat2
+    carry the precomputed latitude cosines so the kernel only evaluates
+    the two half-difference sines per pair. The whole batch is computed
+    in vectorized numpy expressions.
+
+    :return: distances in km
+    :rtype: numpy.ndarray
+    """
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = (
+        np.sin(dlat / 2) ** 2
+        + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if numba is not None:
+
+    # fastmath without "nnan"/"ninf": unresolved codes flow through the
+    # kernel as NaN coordinates and must come out as NaN distances
+    @numba.njit(
+        parallel=True,
+        fastmath={"contract", "arcp", "afn", "reassoc"},
+        cache=True,
+    )
+    def _haversine_batch(
+        lat1, lon1, lat2, lon2, cos_lat1, cos_lat2
+    ):  # pragma: no cover
+        n = lat1.shape[0]
+        out = np.empty(n)
+        for i in numba.prange(n):
+            dlat = lat2[i] - lat1[i]
+            dlon = lon2[i] - lon1[i]
+            a = (
+                np.sin(dlat / 2) ** 2
+                + cos_lat1[i] * cos_lat2[i] * np.sin(dlon / 2) ** 2
+            )
+            out[i] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return out
+
+else:
+    _haversine_batch = _haversine_batch_np
+
+# frozenset for O(1) membership checks on every query
+COUNTRIES_VALID = frozenset([
     "AD",
     "AR",
     "AS",
@@ -121,7 +196,45 @@ COUNTRIES_VALID = [
     "WF",
     "YT",
     "ZA",
-]
+])
+
+
+# Explicit type for every geonames column, so parsing never runs a type
+# inference pass and code fields keep their leading zeros.
+DATA_FIELD_TYPES = {
+    "country_code": pa.string(),
+    "postal_code": pa.string(),
+    "place_name": pa.string(),
+    "state_name": pa.string(),
+    "state_code": pa.string(),
+    "county_name": pa.string(),
+    "county_code": pa.string(),
+    "community_name": pa.string(),
+    "community_code": pa.string(),
+    "latitude": pa.float64(),
+    "longitude": pa.float64(),
+    # float, not int: accuracy has empty values, and legacy CSV caches
+    # serialize it as float (e.g. "4.0") for the same reason
+    "accuracy": pa.float64(),
+}
+
+
+def _parse_geonames_tsv(fh: Any) -> pd.DataFrame:
+    """Parse a geonames TSV stream with the pyarrow CSV reader
+
+    The pyarrow reader is several times faster than the pandas parser on
+    the headerless tab-separated geonames files, and the fully typed
+    column map skips inference entirely.
+
+    Returns the parsed data as a pandas DataFrame.
+    """
+    table = pacsv.read_csv(
+        fh,
+        read_options=pacsv.ReadOptions(column_names=DATA_FIELDS),
+        parse_options=pacsv.ParseOptions(delimiter="\t"),
+        convert_options=pacsv.ConvertOptions(column_types=DATA_FIELD_TYPES),
+    )
+    return table.to_pandas()
 
 
 @contextlib.contextmanager
@@ -132,14 +245,28 @@ def _open_extract_url(url: str, country: str) -> Any:
 
     Returns the opened file object.
     """
-    with urllib.request.urlopen(url) as res:
-        with BytesIO(res.read()) as reader:
-            if url.endswith(".zip"):
-                with ZipFile(reader) as fh_zip:
+    res = _HTTP.request("GET", url, preload_content=False)
+    try:
+        if res.status >= 400:
+            raise urllib3.exceptions.HTTPError(
+                f"download of {url} failed with status {res.status}"
+            )
+        if url.endswith(".zip"):
+            # ZipFile needs seekable access, so spool the archive to a
+            # temp file that only spills to disk past 8 MB
+            with tempfile.SpooledTemporaryFile(
+                max_size=8 * 1024 * 1024
+            ) as tmp:
+                shutil.copyfileobj(res, tmp)
+                with ZipFile(tmp) as fh_zip:
                     with fh_zip.open(country.upper() + ".txt") as fh:
                         yield fh
-            else:
-                yield reader
+        else:
+            # plain text files can be consumed straight off the socket,
+            # urllib3 decodes the gzip content-encoding transparently
+            yield res
+    finally:
+        res.release_conn()
 
 
 @contextlib.contextmanager
@@ -159,7 +286,7 @@ def _open_extract_cycle_url(urls: List[str], country: str) -> Any:
                 yield fh
             # Found a working URL, exit the loop.
             break
-        except urllib.error.HTTPError as err:  # type: ignore
+        except urllib3.exceptions.HTTPError as err:
             if idx == len(urls) - 1:
                 raise
             warnings.warn(
@@ -170,6 +297,16 @@ def _open_extract_cycle_url(urls: List[str], country: str) -> Any:
     else:
         raise ValueError(err_msg)
 
+def _preprocess_code_split(code):
+    """Keep the first block of an upper-cased postal code (GB/IE/CA)"""
+    return code.split()[0]
+
+
+def _preprocess_code_passthrough(code):
+    """Return an upper-cased postal code unchanged"""
+    return code
+
+
 class GlobalGeoDistance:
     """
     * Support cross-country geo distance computation
@@ -177,7 +314,17 @@ class GlobalGeoDistance:
     """
     
     def __init__(self, force_download=False):
-        self._unique_geo_data = {} # store unique geo data
+        # store unique geo data, bounded LRU keyed by country
+        self._unique_geo_data = OrderedDict()
+        # per-country lookup index for fast queries, bounded LRU like
+        # the DataFrame cache above
+        self._lookup = OrderedDict()
+        # country -> specialized preprocessing function, so the per-call
+        # path is a dict get plus one call with no country branching
+        self._preprocess = {
+            country: _preprocess_code_split
+            for country in ("GB", "IE", "CA")
+        }
         self._force_download = force_download
         
     @property
@@ -189,11 +336,164 @@ class GlobalGeoDistance:
         return self._force_download
     
     def get_raw_geo_data_path(self, country):
-        return os.path.join(STORAGE_DIR, country.upper() + ".txt")
-    
-    def get_unique_geo_data_path(self, country):
-        return os.path.join(STORAGE_DIR, country.upper() + "-index.txt")
-    
+        return os.path.join(STORAGE_DIR, country.upper() + ".txt.gz")
+
+    def get_unique_coords_path(self, country):
+        return os.path.join(STORAGE_DIR, country.upper() + "-coords.parquet")
+
+    def get_unique_meta_path(self, country):
+        return os.path.join(STORAGE_DIR, country.upper() + "-meta.parquet")
+
+    def get_lookup_path(self, country):
+        return os.path.join(STORAGE_DIR, country.upper() + "-lookup.pkl")
+
+    def _store_lookup(self, country, lookup):
+        """
+        Insert a lookup index into the bounded in-memory cache
+
+        :param str country: country name (already upper-cased)
+        :param dict lookup: lookup index
+
+        :return: the stored lookup index
+        :rtype: dict
+        """
+
+        self._lookup[country] = lookup
+        self._lookup.move_to_end(country)
+        if len(self._lookup) > UNIQUE_GEO_CACHE_SIZE:
+            self._lookup.popitem(last=False)
+
+        return lookup
+
+    def _build_lookup(self, country, codes, latitude, longitude):
+        """
+        Build and cache the lookup index for a country
+
+        :param str country: country name (already upper-cased)
+        :param codes: postal codes, array-like of str
+        :param latitude: latitudes in degrees, numpy array
+        :param longitude: longitudes in degrees, numpy array
+
+        :return: lookup index
+        :rtype: dict
+        """
+
+        lat_rad = np.deg2rad(latitude)
+        lon_rad = np.deg2rad(longitude)
+        # structure-of-arrays layout: one row-index dict plus float32
+        # columns, which halves the bytes moved through the haversine
+        # kernel (float32 is ~1m resolution, well below centroid error)
+        lookup = {
+            "idx": dict(zip(codes, range(len(codes)))),
+            "lat": latitude.astype(np.float32),
+            "lon": longitude.astype(np.float32),
+            "lat_rad": lat_rad.astype(np.float32),
+            "lon_rad": lon_rad.astype(np.float32),
+            "cos_lat": np.cos(lat_rad).astype(np.float32),
+        }
+        lookup_path = self.get_lookup_path(country)
+        if not os.path.exists(lookup_path) or self.force_download:
+            with open(lookup_path, "wb") as fh:
+                pickle.dump(lookup, fh, protocol=5)
+
+        return self._store_lookup(country, lookup)
+
+    def _ensure_lookup(self, country):
+        """
+        Make the lookup index for a country available in memory
+
+        Tries the pickled lookup cache first for a zero-parse warm
+        start, then a coordinates-only pyarrow read of the unique geo
+        parquet, and only falls back to the full pandas load when
+        neither cache exists yet.
+
+        :param str country: country name (already upper-cased)
+
+        :return: lookup index if available otherwise None
+        :rtype: dict
+        """
+
+        if country in self._lookup:
+            self._lookup.move_to_end(country)
+            return self._lookup[country]
+
+        lookup_path = self.get_lookup_path(country)
+        if os.path.exists(lookup_path) and not self.force_download:
+            with open(lookup_path, "rb") as fh:
+                lookup = pickle.load(fh)
+            if isinstance(lookup, dict) and "idx" in lookup:
+                return self._store_lookup(country, lookup)
+            # lookup pickled by an older version, rebuild it
+            os.remove(lookup_path)
+
+        coords_path = self.get_unique_coords_path(country)
+        if os.path.exists(coords_path) and not self.force_download:
+            # the hot path only needs coordinates, so read the lean
+            # coords file straight through pyarrow and skip the
+            # DataFrame construction entirely
+            table = paparquet.read_table(coords_path, memory_map=True)
+            return self._build_lookup(
+                country,
+                table["postal_code"].to_pylist(),
+                table["latitude"].to_numpy(),
+                table["longitude"].to_numpy(),
+            )
+
+        self.get_unique_geo_data(country)
+        return self._lookup.get(country)
+
+    def _load_legacy_unique_cache(self, country):
+        """
+        One-time load of a legacy unique-data cache file
+
+        Handles both the single -index.parquet file and the older
+        -index.txt CSV; the file is removed after loading so it gets
+        rewritten in the split coords/meta layout.
+
+        :param str country: country name (already upper-cased)
+
+        :return: legacy data if a legacy file existed otherwise None
+        :rtype: pandas.DataFrame
+        """
+
+        legacy_parquet = os.path.join(STORAGE_DIR, country + "-index.parquet")
+        legacy_txt = os.path.join(STORAGE_DIR, country + "-index.txt")
+        if os.path.exists(legacy_parquet):
+            data = pd.read_parquet(legacy_parquet)
+            os.remove(legacy_parquet)
+        elif os.path.exists(legacy_txt):
+            data = pd.read_csv(legacy_txt, dtype={"postal_code": str})
+            os.remove(legacy_txt)
+        else:
+            data = None
+
+        return data
+
+    def _write_unique_cache(self, unique_geo_data, coords_path, meta_path):
+        """
+        Persist the unique geo data as split coords and meta files
+
+        The lean coords file carries only what the query hot path
+        reads; the remaining wide columns go to the meta file.
+
+        :param pandas.DataFrame unique_geo_data: unique geo data
+        :param str coords_path: target coords parquet path
+        :param str meta_path: target meta parquet path
+        """
+
+        coords_fields = ["postal_code", "latitude", "longitude"]
+        meta_fields = [
+            key
+            for key in DATA_FIELDS
+            if key not in ("latitude", "longitude")
+        ]
+        unique_geo_data[coords_fields].to_parquet(
+            coords_path, compression="zstd"
+        )
+        unique_geo_data[meta_fields].to_parquet(
+            meta_path, compression="zstd"
+        )
+
     def get_raw_geo_data(self, country):
         """
         Get raw geo data
@@ -205,23 +505,40 @@ class GlobalGeoDistance:
         """
         
         data_path = self.get_raw_geo_data_path(country)
-        if os.path.exists(data_path) and not self.force_download:
-            data = pd.read_csv(data_path, dtype={"postal_code": str})
-        else:
-            download_urls = [
-                val.format(country=country) for val in DOWNLOAD_URL
-            ]
-            with _open_extract_cycle_url(download_urls, country) as fh:
-                data = pd.read_csv(
-                    fh,
-                    sep="\t",
-                    header=None,
-                    names=DATA_FIELDS,
-                    dtype={"postal_code": str},
-                )
+        legacy_path = os.path.join(STORAGE_DIR, country.upper() + ".txt")
+        if not os.path.exists(data_path) or self.force_download:
             os.makedirs(STORAGE_DIR, exist_ok=True)
-            data.to_csv(data_path, index=None)
-            
+            if os.path.exists(legacy_path) and not self.force_download:
+                # one-time migration of a legacy CSV cache
+                legacy_data = pd.read_csv(
+                    legacy_path, dtype={"postal_code": str}
+                )
+                legacy_data.to_csv(
+                    data_path, sep="\t", header=False, index=False
+                )
+                # only drop the legacy file once the rewritten cache
+                # has parsed successfully, so a failed migration never
+                # destroys the only good copy of the data
+                try:
+                    with pa.input_stream(data_path, compression="gzip") as fh:
+                        data = _parse_geonames_tsv(fh)
+                except Exception:
+                    os.remove(data_path)
+                    raise
+                os.remove(legacy_path)
+                return data
+            else:
+                download_urls = [
+                    val.format(country=country) for val in DOWNLOAD_URL
+                ]
+                # gzip the TSV bytes straight to disk, no pandas round-trip
+                with _open_extract_cycle_url(download_urls, country) as fh:
+                    with gzip.open(data_path, "wb") as fh_gz:
+                        shutil.copyfileobj(fh, fh_gz)
+
+        with pa.input_stream(data_path, compression="gzip") as fh:
+            data = _parse_geonames_tsv(fh)
+
         return data
         
     def get_unique_geo_data(self, country):
@@ -237,6 +554,7 @@ class GlobalGeoDistance:
         country = country.upper()
         
         if country in self._unique_geo_data:
+            self._unique_geo_data.move_to_end(country)
             return self._unique_geo_data[country]
         
         if country not in COUNTRIES_VALID:
@@ -256,32 +574,67 @@ class GlobalGeoDistance:
                 "in 1999."
             )
         
-        raw_geo_data = self.get_raw_geo_data(country)
-        
-        unique_geo_data_path = self.get_unique_geo_data_path(country)
+        coords_path = self.get_unique_coords_path(country)
+        meta_path = self.get_unique_meta_path(country)
 
-        if os.path.exists(unique_geo_data_path) and not self.force_download:
-            unique_geo_data = pd.read_csv(
-                unique_geo_data_path, dtype={"postal_code": str}
-            )
+        if (
+            os.path.exists(coords_path)
+            and os.path.exists(meta_path)
+            and not self.force_download
+        ):
+            coords = pd.read_parquet(coords_path, memory_map=True)
+            meta = pd.read_parquet(meta_path, memory_map=True)
+            unique_geo_data = coords.merge(meta, on="postal_code")[
+                DATA_FIELDS
+            ]
         else:
-            # group together places with the same postal code
-            df_unique_cp_group = raw_geo_data.groupby("postal_code")
-            unique_geo_data = df_unique_cp_group[["latitude", "longitude"]].mean()
-            valid_keys = set(DATA_FIELDS).difference(
-                ["place_name", "lattitude", "longitude", "postal_code"]
-            )
-            unique_geo_data["place_name"] = df_unique_cp_group["place_name"].apply(
-                lambda x: ", ".join([str(el) for el in x])
-            )
-            for key in valid_keys:
-                unique_geo_data[key] = df_unique_cp_group[key].first()
-            unique_geo_data = unique_geo_data.reset_index()[DATA_FIELDS]
-            unique_geo_data.to_csv(unique_geo_data_path, index=None)
-            
+            unique_geo_data = None
+            if not self.force_download:
+                unique_geo_data = self._load_legacy_unique_cache(country)
+            if unique_geo_data is None:
+                raw_geo_data = self.get_raw_geo_data(country)
+                # group together places with the same postal code
+                means = raw_geo_data.groupby("postal_code", sort=False)[
+                    ["latitude", "longitude"]
+                ].mean()
+                # cast once so the join aggregation never stringifies
+                # per element
+                place_names = raw_geo_data["place_name"].astype(str)
+                places = place_names.groupby(
+                    raw_geo_data["postal_code"], sort=False
+                ).agg(", ".join)
+                first_keys = [
+                    key
+                    for key in DATA_FIELDS
+                    if key
+                    not in (
+                        "place_name",
+                        "latitude",
+                        "longitude",
+                        "postal_code",
+                    )
+                ]
+                firsts = raw_geo_data.drop_duplicates(
+                    "postal_code", keep="first"
+                ).set_index("postal_code")[first_keys]
+                unique_geo_data = pd.concat([means, places, firsts], axis=1)
+                unique_geo_data = unique_geo_data.reset_index()[DATA_FIELDS]
+            self._write_unique_cache(unique_geo_data, coords_path, meta_path)
+
+
         unique_geo_data = unique_geo_data.set_index('postal_code')
         self._unique_geo_data[country] = unique_geo_data
-        
+        self._build_lookup(
+            country,
+            unique_geo_data.index.to_numpy(),
+            unique_geo_data["latitude"].to_numpy(),
+            unique_geo_data["longitude"].to_numpy(),
+        )
+        # the lookup cache bounds itself in _store_lookup, so evicting a
+        # DataFrame does not drop a possibly still-hot lookup with it
+        if len(self._unique_geo_data) > UNIQUE_GEO_CACHE_SIZE:
+            self._unique_geo_data.popitem(last=False)
+
         return unique_geo_data
     
     def preprocess_postal_code(self, code, country):
@@ -299,17 +652,14 @@ class GlobalGeoDistance:
         
         if isinstance(code, int):
             code = str(code)
-            
+
         if code == '':
             return code
-        
-        country = country.upper()
-        
-        code = code.upper()
-        if country in ["GB", "IE", "CA"]:
-            code = code.split()[0] # code != ''
-            
-        return code
+
+        preprocess = self._preprocess.get(
+            country.upper(), _preprocess_code_passthrough
+        )
+        return preprocess(code.upper())
     
     def get_geolocation(self, code, country):
         """
@@ -322,21 +672,44 @@ class GlobalGeoDistance:
         :rtype: binary tuple of float
         """
 
+        record = self._get_geo_record(code, country)
+        if record is None:
+            return None
+
+        return record[:2]
+
+    def _get_geo_record(self, code, country):
+        """
+        Resolve a postal code to its full lookup record
+
+        :param code: postal code, str or int
+        :param str country: country name
+
+        :return: (latitude, longitude, lat_rad, lon_rad, cos_lat) if
+            resolved otherwise None
+        :rtype: tuple of float
+        """
+
+        # normalize once and reuse, instead of per-callee .upper() calls
+        country = country.upper()
         code = self.preprocess_postal_code(code, country)
-        unique_geo_data = self.get_unique_geo_data(country)
-        
-        try:
-            geolocation = tuple(
-                unique_geo_data.loc[
-                    code, ['latitude', 'longitude']
-                ].values
-            )
-        except:
-            # either unique_geo_data is None or code not supported
-            raise
+
+        lookup = self._ensure_lookup(country)
+        if lookup is None:
+            # unique geo data could not be loaded for this country
             return None
-            
-        return geolocation
+
+        row = lookup["idx"].get(code)
+        if row is None:
+            return None
+
+        return (
+            float(lookup["lat"][row]),
+            float(lookup["lon"][row]),
+            lookup["lat_rad"][row],
+            lookup["lon_rad"][row],
+            lookup["cos_lat"][row],
+        )
     
     def query_postal_code(self, code_x, country_x, code_y, country_y):
         """
@@ -364,6 +737,53 @@ class GlobalGeoDistance:
         
         return dist
         
+    def query_postal_codes(self, codes_x, countries_x, codes_y, countries_y):
+        """
+        Get distances (in km) between pairs of postal codes
+
+        Vectorized counterpart of query_postal_code: coordinates are
+        resolved once per element and the haversine formula runs on the
+        whole batch in numpy.
+
+        :param codes_x: postal codes, array-like of str or int
+        :param countries_x: country names, array-like of str
+        :param codes_y: postal codes, array-like of str or int
+        :param countries_y: country names, array-like of str
+
+        :return: calculated distances, NaN where a code is not resolved
+        :rtype: numpy.ndarray of float
+        """
+
+        codes_x = [str(val) for val in codes_x]
+        countries_x = list(countries_x)
+        codes_y = [str(val) for val in codes_y]
+        countries_y = list(countries_y)
+        n = len(codes_x)
+        if not (len(countries_x) == len(codes_y) == len(countries_y) == n):
+            raise ValueError("all four inputs must have the same length")
+
+        # batch inputs commonly repeat pairs, so compute each distinct
+        # (code, country, code, country) row only once and scatter back
+        pairs = np.array([codes_x, countries_x, codes_y, countries_y]).T
+        unique_pairs, inverse = np.unique(
+            pairs, axis=0, return_inverse=True
+        )
+
+        n_unique = unique_pairs.shape[0]
+        coords = np.full((n_unique, 6), np.nan, dtype=np.float32)
+        for i in range(n_unique):
+            code_x, country_x, code_y, country_y = unique_pairs[i]
+            record_x = self._get_geo_record(code_x, country_x)
+            record_y = self._get_geo_record(code_y, country_y)
+            if record_x is not None and record_y is not None:
+                # lat_rad, lon_rad, cos_lat are precomputed per code
+                coords[i, :3] = record_x[2:]
+                coords[i, 3:] = record_y[2:]
+
+        lat1, lon1, cos_lat1, lat2, lon2, cos_lat2 = coords.T
+        dist = _haversine_batch(lat1, lon1, lat2, lon2, cos_lat1, cos_lat2)
+        return dist[inverse]
+
     def query_geolocation(self, x, y):
         """
         :param tuple x: (latitude, longitude), tuple of float
@@ -376,4 +796,26 @@ class GlobalGeoDistance:
         res = 0
         if x != y:
             res = haversine.haversine(x, y)
-        return res
\ No newline at end of file
+        return res
+
+    def query_geolocations(self, xs, ys):
+        """
+        Get distances (in km) between arrays of geolocations
+
+        Uses haversine_vector so the whole batch is processed in numpy
+        instead of one scalar haversine call per pair. Unlike
+        query_postal_codes there are no precomputed per-code cosines
+        here, since the coordinates are caller-provided.
+
+        :param xs: (latitude, longitude) pairs, array-like of shape (n, 2)
+        :param ys: (latitude, longitude) pairs, array-like of shape (n, 2)
+
+        :return: calculated distances
+        :rtype: numpy.ndarray of float
+        """
+
+        return haversine.haversine_vector(
+            np.asarray(xs, dtype=np.float64),
+            np.asarray(ys, dtype=np.float64),
+            haversine.Unit.KILOMETERS,
+        )
\ No newline at end of file